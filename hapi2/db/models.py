@@ -1,15 +1,36 @@
 import re
+import struct
+import weakref
 import binascii
 import numpy as np
+from operator import attrgetter
+from functools import lru_cache
+from itertools import chain
+
+try:
+    from numpy import trapezoid as _trapz
+except ImportError: # numpy<2.0
+    from numpy import trapz as _trapz
 
 from hapi2.config import VARSPACE        
 
 from hapi2.utils.formula import molweight,atoms,natoms
 
 from hapi2.utils.xsc import compress_zlib, decompress_zlib, \
-    pack_double, unpack_double, pack_float, unpack_float
+    compress_blob, decompress_blob, \
+    pack_double, unpack_double, pack_float, unpack_float, \
+    pack_uint16_quantized, unpack_uint16_quantized, \
+    downsample, downsample_size
+
+from hapi2.utils.xsc_kernels import average_same_points_nb, range_nb
+
+from hapi import HITRAN_DEFAULT_HEADER, AtoB
 
-from hapi import putRowObjectToString,HITRAN_DEFAULT_HEADER, AtoB
+def _unique(iterables):
+    """
+    Merge iterables into a list of unique items keeping the order.
+    """
+    return list(dict.fromkeys(chain.from_iterable(iterables)))
 
 def get_alias_class(cls):
     """
@@ -320,6 +341,20 @@ class PartitionFunction:
     def __repr__(self):
         return self.__str__()
 
+@lru_cache(maxsize=None)
+def get_interpolator_class():
+    """
+    Import the spline interpolator once per process.
+    """
+    from scipy.interpolate import Akima1DInterpolator
+    return Akima1DInterpolator # better then Pchip if remove close points!
+
+# Format tags for the cross-section data blobs.
+# Legacy blobs are plain zlib streams which always start with b'x'.
+XSC_FORMAT_UINT16 = b'q'
+NU_FORMAT_UNIFORM = b'u'
+NU_FORMAT_DELTA = b'd'
+
 class CrossSectionData:
     """
     Stores the actual data for the header given in CrossSection.
@@ -328,23 +363,49 @@ class CrossSectionData:
     Single precision for absorption section gives around 5e-6 percent
     difference in accuracy, but reduces the database size twice.
     For wave numbers, single precision generally is not enough.
+    
+    Uniform wave number grids are stored as the (first point, last point,
+    number of points) triple, other grids may be delta-encoded. Either
+    encoding is used only if it restores the grid bit-exactly.
+    If quantize is set, absorption cross-section is quantized
+    to 2-byte integers with a per-blob offset and scale. Such blobs
+    start with a one-byte format tag, legacy blobs are raw zlib streams.
+    If zstd is set, payloads are compressed with zstd instead of zlib:
+    about the same size and faster to unpack, but the optional
+    zstandard package is needed to read them.
     """
     
-    def __init__(self,nu=None,xsc=None):
+    __xsc_quantize__ = False
+    __blob_zstd__ = False
+    
+    def __init__(self,nu=None,xsc=None,quantize=False,zstd=False):
+        self.__nu_cache__ = None; self.__xsc_cache__ = None
+        self.__xsc_quantize__ = quantize
+        self.__blob_zstd__ = zstd
         if nu is not None: self.pack_nu(nu)
         if xsc is not None: self.pack_xsc(xsc)
     
     def unpack_nu(self):
         data_nu = self.b__nu__
-        if not data_nu and \
-           self.header.numin and \
-           self.header.numax and \
-           self.header.npnts:
-            return np.linspace(self.header.numin,
-                self.header.numax,self.header.npnts)
+        if data_nu is None or len(data_nu)==0:
+            # no blob: restore the grid from the header
+            header = self.header
+            if header.numin and header.numax and header.npnts:
+                self.__nu_sorted__ = True
+                return np.linspace(header.numin,header.numax,header.npnts)
+            print('nu is empty')
+            return None
         else:
             try:
-                return np.array(unpack_double(decompress_zlib(data_nu)))
+                if data_nu[:1]==NU_FORMAT_UNIFORM:
+                    nu0,nu1,npnts = struct.unpack('<ddq',data_nu[1:])
+                    self.__nu_sorted__ = bool(nu1>=nu0)
+                    return np.linspace(nu0,nu1,npnts)
+                elif data_nu[:1]==NU_FORMAT_DELTA:
+                    nu0, = struct.unpack('<d',data_nu[1:9])
+                    d = unpack_double(decompress_blob(data_nu[9:]))
+                    return nu0 + np.cumsum(np.concatenate(([0.0],d)))
+                return np.array(unpack_double(decompress_blob(data_nu)))
             except Exception as e:
                 print('nu is empty: %s'%e)
                 return None
@@ -354,14 +415,60 @@ class CrossSectionData:
         if not data_xsc:
             print('xsc is empty')
             return None
+        elif data_xsc[:1]==XSC_FORMAT_UINT16:
+            xmin,scale = struct.unpack('<dd',data_xsc[1:17])
+            return unpack_uint16_quantized(
+                decompress_blob(data_xsc[17:]),xmin,scale)
         else:
-            return np.array(unpack_double(decompress_zlib(data_xsc)))
+            return np.array(unpack_double(decompress_blob(data_xsc)))
+
+    def get_sorted(self):
+        """
+        Get unpacked nu and xsc sorted by wave number.
+        The result is cached until the data are re-packed.
+        """
+        if self.__dict__.get('__nu_cache__') is None or \
+           self.__dict__.get('__xsc_cache__') is None:
+            nu = self.unpack_nu(); xsc = self.unpack_xsc()
+            if nu is None or xsc is None:
+                return nu,xsc
+            if not getattr(self,'__nu_sorted__',False) and \
+               not np.all(nu[1:]>=nu[:-1]):
+                # mergesort is nearly linear on almost sorted grids
+                sort_ind = np.argsort(nu,kind='mergesort')
+                nu = nu[sort_ind]; xsc = xsc[sort_ind]
+            # cached arrays are shared between calls, protect them
+            nu.flags.writeable = False; xsc.flags.writeable = False
+            self.__nu_cache__ = nu
+            self.__xsc_cache__ = xsc
+        return self.__nu_cache__,self.__xsc_cache__
 
     def pack_nu(self,nu):
-        self.b__nu__ = compress_zlib(pack_double(nu))
+        self.__nu_cache__ = None
+        nu = np.asarray(nu,dtype=np.float64)
+        d = np.diff(nu)
+        self.__nu_sorted__ = bool(np.all(d>=0))
+        # compact encodings are used only if they restore nu bit-exactly
+        if len(nu)>1 and \
+           np.array_equal(np.linspace(nu[0],nu[-1],len(nu)),nu):
+            # uniform grid: store only the grid parameters
+            self.b__nu__ = NU_FORMAT_UNIFORM + \
+                struct.pack('<ddq',nu[0],nu[-1],len(nu))
+        elif len(nu)>1 and \
+           np.array_equal(nu[0]+np.cumsum(np.concatenate(([0.0],d))),nu):
+            self.b__nu__ = NU_FORMAT_DELTA + \
+                struct.pack('<d',nu[0]) + compress_blob(pack_double(d),self.__blob_zstd__)
+        else:
+            self.b__nu__ = compress_blob(pack_double(nu),self.__blob_zstd__)
 
     def pack_xsc(self,xsc):
-        self.b__xsc__ = compress_zlib(pack_double(xsc))
+        self.__xsc_cache__ = None
+        if self.__xsc_quantize__:
+            buf,xmin,scale = pack_uint16_quantized(xsc)
+            self.b__xsc__ = XSC_FORMAT_UINT16 + \
+                struct.pack('<dd',xmin,scale) + compress_blob(buf,self.__blob_zstd__)
+        else:
+            self.b__xsc__ = compress_blob(pack_double(xsc),self.__blob_zstd__)
 
 class CrossSection:
 
@@ -460,7 +567,7 @@ class CrossSection:
     def source(self):
         return self.source_alias.source
 
-    def set_data(self,nu=None,xsc=None):
+    def set_data(self,nu=None,xsc=None,quantize=False,zstd=False):
         if xsc is None:
             raise Exception('xsc must be non-empty')
         if nu is None:
@@ -469,11 +576,11 @@ class CrossSection:
             self.npnts = len(xsc)
         elif len(nu)!=len(xsc):
             raise Exception('nu and xsc must have the same length')
-        self.data = VARSPACE['db_backend'].models.CrossSectionData(nu,xsc)
+        self.data = VARSPACE['db_backend'].models.CrossSectionData(nu,xsc,quantize,zstd)
         if nu is not None:
             #self.data.pack_nu(nu)
-            self.numin = min(nu)
-            self.numax = max(nu)
+            self.numin = float(np.min(nu))
+            self.numax = float(np.max(nu))
         #self.data.pack_xsc(xsc)
 
     def get_data(self):
@@ -489,17 +596,12 @@ class CrossSection:
         """
         Get the part of the cross section
         lying within the given wave number range.
+        Returned arrays are read-only views of the cached data.
         """
-        from bisect import bisect
-        nu,xsc = self.get_data()
-        if numin is None: numin = min(nu) - 10
-        if numax is None: numax = max(nu) + 10
-        nu = np.array(nu); xsc = np.array(xsc)
-        sort_ind = np.argsort(nu) # works faster than the latter option
-        nu = nu[sort_ind]; xsc = xsc[sort_ind]
-        i1 = bisect(nu,numin); i2 = bisect(nu,numax)
-        nu_cut = nu[i1:i2]; xsc_cut = xsc[i1:i2]
-        return nu_cut,xsc_cut
+        nu,xsc = self.data.get_sorted()
+        if numin is None: numin = nu[0] - 10 # nu is sorted
+        if numax is None: numax = nu[-1] + 10
+        return range_nb(nu,xsc,numin,numax)
 
     def subset(self,numin,numax):
         """
@@ -512,23 +614,23 @@ class CrossSection:
         Calculate integrated intensity in
         the given spectral region.
         """
-        from scipy.integrate import trapz
         nu_cut,xsc_cut = self.range(numin,numax)
-        return trapz(xsc_cut,nu_cut)
+        return _trapz(xsc_cut,nu_cut)
 
     def interpolate(self,grid,clean=False):
-        from scipy.interpolate import interp1d,Akima1DInterpolator,PchipInterpolator
-        INTERPOLATOR = Akima1DInterpolator # better then Pchip if remove close points!
+        INTERPOLATOR = get_interpolator_class()
         nu,xsc = self.range(grid[0]-10,grid[-1]+10) # take slightly more wide region for interpolation.
         if clean:
-            nu,xsc = average_same_points(nu,xsc)
-            nu = np.array(nu); xsc = np.array(xsc)
+            nu,xsc = average_same_points_nb(nu,xsc)
         interp = INTERPOLATOR(nu,xsc)
         return interp(grid)
 
     def downsample(self,delta,numin=None,numax=None,type='triangular'):
         nu,xsc = self.range(numin,numax)
-        binned_nu,binned_xsc = downsample(nu,xsc,delta,type)
+        if numin is None: numin = nu[0]
+        if numax is None: numax = nu[-1]
+        out = np.empty(downsample_size(numin,numax,delta))
+        binned_nu,binned_xsc = downsample(nu,xsc,delta,type,numin,numax,out=out)
         return binned_nu,binned_xsc
 
     def compare(self,xs,numin,numax,grid=None):
@@ -642,7 +744,7 @@ class CIACrossSection(CrossSection):
     def source(self):
         return self.source_alias.source
         
-    def set_data(self,nu=None,xsc=None):
+    def set_data(self,nu=None,xsc=None,quantize=False,zstd=False):
         if xsc is None:
             raise Exception('xsc must be non-empty')
         if nu is None:
@@ -651,11 +753,11 @@ class CIACrossSection(CrossSection):
             self.npnts = len(xsc)
         elif len(nu)!=len(xsc):
             raise Exception('nu and xsc must have the same length')
-        self.data = VARSPACE['db_backend'].models.CIACrossSectionData(nu,xsc)
+        self.data = VARSPACE['db_backend'].models.CIACrossSectionData(nu,xsc,quantize,zstd)
         if nu is not None:
             #self.data.pack_nu(nu)
-            self.numin = min(nu)
-            self.numax = max(nu)
+            self.numin = float(np.min(nu))
+            self.numax = float(np.max(nu))
         #self.data.pack_xsc(xsc)
 
     def __str__(self):
@@ -747,24 +849,15 @@ class Source:
 
     @property
     def cross_sections(self):
-        xss = set()
-        for source_alias in self.aliases:
-            xss.update(source_alias.cross_sections)
-        return list(xss)
+        return _unique(source_alias.cross_sections for source_alias in self.aliases)
     
     @property
     def cia_cross_sections(self):
-        xss = set()
-        for source_alias in self.aliases:
-            xss.update(source_alias.cia_cross_sections)
-        return list(xss)
+        return _unique(source_alias.cia_cross_sections for source_alias in self.aliases)
         
     @property
     def partition_functions(self):
-        pfuncs = set()
-        for source_alias in self.aliases:
-            pfuncs.update(source_alias.partition_functions)
-        return list(pfuncs)
+        return _unique(source_alias.partition_functions for source_alias in self.aliases)
 
     @property
     def transition_parameters(self):
@@ -846,16 +939,70 @@ class Linelist:
     def cross_sections(self):
         raise NotImplementedError
 
+PAR_FORMAT_REGEX = re.compile(r'^\%(\d*)(\.(\d*))?([edfsEDFS])$')
+
+def compile_par_format(par_format):
+    """
+    Make a single-value formatter for the Fortran-like format.
+    Follows the rules of hapi.formatString, but parses the format only once.
+    """
+    lng,_,lngpnt,ty = PAR_FORMAT_REGEX.search(par_format).groups()
+    if ty.lower() not in ('f','e'):
+        return par_format.__mod__
+    lng = int(lng) if lng else 0
+    lngpnt = int(lngpnt) if lngpnt else 0
+    pad_format = '%%%ds'%lng
+    strip_zero = lng==lngpnt+1
+    def formatter(par_value):
+        result = par_format%par_value
+        if strip_zero or par_value<0:
+            res = result.strip()
+            if strip_zero and res[0:1]=='0':
+                result = pad_format%res[1:]
+            if par_value<0 and res[1:2]=='0':
+                result = pad_format%(res[0:1]+res[2:])
+        return result
+    return formatter
+
+_PAR_GETTER = attrgetter(*HITRAN_DEFAULT_HEADER['order'])
+_PAR_FORMATTERS = tuple(compile_par_format(HITRAN_DEFAULT_HEADER['format'][par_name]) \
+    for par_name in HITRAN_DEFAULT_HEADER['order'])
+
+def format_par_line(trans):
+    """
+    Serialize transition to the 160-char HITRAN line.
+    """
+    return ''.join([formatter(par_value) for formatter,par_value in \
+        zip(_PAR_FORMATTERS,_PAR_GETTER(trans))])
+
+# (name, getter, format) for each parameter of the 160-char HITRAN line.
+# createRowObject is not used by par_line anymore, but is kept as public API
+# producing the row objects for hapi.putRowObjectToString.
+_ROW_SPECS = tuple(
+    (par_name,attrgetter(par_name),HITRAN_DEFAULT_HEADER['format'][par_name]) \
+    for par_name in HITRAN_DEFAULT_HEADER['order'])
+
 def createRowObject(trans):
-    RowObject = []
-    for par_name in HITRAN_DEFAULT_HEADER['order']:
-        par_value = getattr(trans,par_name)
-        par_format = HITRAN_DEFAULT_HEADER['format'][par_name]
-        RowObject.append((par_name,par_value,par_format))
-    return RowObject
+    return [(par_name,getter(trans),par_format) \
+        for par_name,getter,par_format in _ROW_SPECS]
+
+@lru_cache(maxsize=65536)
+def parse_par_line_cached(par_line):
+    """
+    Parse 160-char line into the transition with upper and lower states.
+    Identical lines are parsed only once.
+    """
+    return HITRANTransition.parse_par_line(par_line)
 
 def get_state_key(state):
-    return (state.molec_id,state.local_iso_id,*tuple(state.qns.items()))
+    try:
+        return state.__state_key__
+    except AttributeError:
+        # canonical form, independent of the qns insertion order
+        qns_str = '|'.join(['%r=%r'%item for item in sorted(state.qns.items())])
+        key = state.__state_key__ = '%r|%r|%s'%\
+            (state.molec_id,state.local_iso_id,qns_str)
+        return key
 
 class Transition:
 
@@ -897,7 +1044,8 @@ class Transition:
 
     __backrefs__ = {}
         
-    __states__ = {}
+    # states are kept only while some transition refers to them
+    __states__ = weakref.WeakValueDictionary()
 
     def __init__(self,isotopologue,**kwargs):
         # set isotopologue alias
@@ -935,34 +1083,37 @@ class Transition:
         return self.source_alias.source
 
     def __fill_states__(self):
-        t = HITRANTransition.parse_par_line(self.par_line)
+        par_line = self.par_line
+        t = parse_par_line_cached(par_line)
         statep = t.statep
         statepp = t.statepp
-        # search for states in the buffer
-        key = get_state_key(statep)
-        if key not in Transition.__states__:
-            Transition.__states__[key] = statep
-        key = get_state_key(statepp)
-        if key not in Transition.__states__:
-            Transition.__states__[key] = statepp
+        # search for states in the buffer, reuse the canonical ones
+        states = Transition.__states__
+        statep = states.setdefault(get_state_key(statep),statep)
+        statepp = states.setdefault(get_state_key(statepp),statepp)
         # save local links to states
         self.__statep__ = statep
         self.__statepp__ = statepp
 
     @property
     def statep(self):
-        if '__statep__' not in self.__dict__: self.__fill_states__()
-        return self.__statep__
+        try:
+            return self.__statep__
+        except AttributeError:
+            self.__fill_states__()
+            return self.__statep__
 
     @property
     def statepp(self):
-        if '__statepp__' not in self.__dict__: self.__fill_states__()
-        return self.__statepp__
+        try:
+            return self.__statepp__
+        except AttributeError:
+            self.__fill_states__()
+            return self.__statepp__
         
     @property
     def par_line(self):
-        rowobj = createRowObject(self)
-        return putRowObjectToString(rowobj)
+        return format_par_line(self)
 
     def __str__(self):
         return self.par_line
@@ -970,6 +1121,112 @@ class Transition:
     def __repr__(self):
         return self.__str__()        
 
+def make_column(values,type_):
+    """
+    Make ndarray column for the values of the given schema type.
+    """
+    if type_ is float:
+        return np.array([np.nan if v is None else v for v in values],dtype=np.float64)
+    if type_ is int:
+        col = np.array(values)
+        if col.dtype.kind in 'iu':
+            return col.astype(np.int64)
+        if col.dtype.kind=='f': # don't truncate non-integer values
+            return col
+    return np.array(values,dtype=object) # missing values, strings etc.
+
+class TransitionTableRow:
+    """
+    Lightweight read-only view on a single row of TransitionTable.
+    """
+    
+    __slots__ = ('__table__','__index__')
+    
+    def __init__(self,table,index):
+        self.__table__ = table
+        self.__index__ = index
+
+    def __getattr__(self,attr):
+        if attr.startswith('__'): # unset slots, copy/pickle protocol lookups
+            raise AttributeError(attr)
+        columns = self.__table__.columns
+        if attr in columns:
+            return columns[attr][self.__index__]
+        raise AttributeError(attr)
+
+    @property
+    def par_line(self):
+        return format_par_line(self)
+
+    def __str__(self):
+        return self.par_line
+
+    def __repr__(self):
+        return self.__str__()
+
+class TransitionTable:
+    """
+    Column-wise (structure of arrays) storage of the transitions.
+    Each parameter from Transition.__keys__ is kept in a separate ndarray,
+    which are accessible as attributes, e.g. table.nu, table.sw.
+    """
+
+    def __init__(self,columns):
+        self.columns = columns
+
+    @classmethod
+    def from_rows(cls,rows,keys=Transition.__keys__):
+        """
+        Make table from the sequence of value tuples ordered as in keys.
+        """
+        rows = list(rows)
+        columns = {}
+        for i,(key,props) in enumerate(keys):
+            columns[key] = make_column([row[i] for row in rows],props['type'])
+        return cls(columns)
+
+    @classmethod
+    def from_transitions(cls,transs):
+        """
+        Make table from the iterable of Transition objects.
+        """
+        getter = attrgetter(*[key for key,_ in Transition.__keys__])
+        return cls.from_rows(getter(trans) for trans in transs)
+
+    def __getattr__(self,attr):
+        columns = self.__dict__.get('columns',{})
+        if attr in columns:
+            return columns[attr]
+        raise AttributeError(attr)
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()),()))
+
+    def __getitem__(self,index):
+        if isinstance(index,(int,np.integer)):
+            n = len(self)
+            if index<0: index += n
+            if not 0<=index<n:
+                raise IndexError('transition index out of range')
+            return TransitionTableRow(self,int(index))
+        # slices, index arrays and boolean masks give new tables
+        return TransitionTable({key:col[index] for key,col in self.columns.items()})
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield TransitionTableRow(self,i)
+
+    def range(self,numin,numax):
+        """
+        Get the transitions lying within the given wave number range.
+        """
+        nu = self.columns['nu']
+        return self[(nu>=numin)&(nu<=numax)]
+
+    @property
+    def par_lines(self):
+        return [row.par_line for row in self]
+
 @searchable
 class IsotopologueAlias:
 
@@ -1061,10 +1318,7 @@ class Isotopologue:
         
     @property
     def partition_functions(self):
-        pfuncs = set()
-        for iso_alias in self.aliases:
-            pfuncs.update(iso_alias.partition_functions)
-        return list(pfuncs)
+        return _unique(iso_alias.partition_functions for iso_alias in self.aliases)
 
 @searchable        
 class MoleculeCategory:
@@ -1086,24 +1340,15 @@ class MoleculeCategory:
 
     @property
     def molecules(self):
-        mols = []
-        for molecule_alias in self.molecule_aliases:
-            mols.append(molecule_alias.molecule)
-        return list(set(mols))
+        return list(dict.fromkeys(molecule_alias.molecule for molecule_alias in self.molecule_aliases))
 
     @property
     def cross_sections(self):
-        xss = set()
-        for mol in self.molecules:
-            xss.update(mol.cross_sections)
-        return list(xss)
+        return _unique(mol.cross_sections for mol in self.molecules)
 
     @property
     def sources(self):
-        srcs = set()
-        for mol in self.molecules:
-            srcs.update(mol.sources)
-        return list(srcs)
+        return _unique(mol.sources for mol in self.molecules)
 
 @searchable              
 class MoleculeAlias:
@@ -1187,56 +1432,42 @@ class Molecule:
 
     @property
     def cross_sections(self):
-        xss = set()
-        for molecule_alias in self.aliases:
-            xss.update(molecule_alias.cross_sections)
-        return list(xss)
+        return _unique(molecule_alias.cross_sections for molecule_alias in self.aliases)
 
     @property
     def isotopologues(self):
-        isos = set()
-        for molecule_alias in self.aliases:
-            isos.update(molecule_alias.isotopologues)
-        return list(isos)
+        return _unique(molecule_alias.isotopologues for molecule_alias in self.aliases)
 
     @property
     def isotopologue_alias_ids(self):
-        isoals = set()
-        for iso in self.isotopologues:
-            isoals.update(iso.aliases)
-        return [isoal.id for isoal in isoals]
+        return [isoal.id for isoal in _unique(iso.aliases for iso in self.isotopologues)]
 
     @property
     def transitions(self):
         raise NotImplementedError
 
+    @property
+    def transition_table(self):
+        """
+        Get the transitions as a column-wise TransitionTable.
+        """
+        return TransitionTable.from_transitions(self.transitions)
+
     @property
     def linelists(self):
-        llists = set()
-        for trans in self.transitions:
-            llists.update(trans.linelists)
-        return list(llists)
+        return _unique(trans.linelists for trans in self.transitions)
 
     @property
     def categories(self):
-        cats = set()
-        for molecule_alias in self.aliases:
-            cats.update(molecule_alias.categories)
-        return list(cats)
+        return _unique(molecule_alias.categories for molecule_alias in self.aliases)
 
     @property
     def sources(self):
-        srcs = []
-        for xs in self.cross_sections:
-            srcs.append(xs.source)
-        return list(set(srcs))
+        return list(dict.fromkeys(xs.source for xs in self.cross_sections))
 
     @property
     def groups(self):
-        grps = []
-        for src in self.sources:
-            grps.append(src.group)
-        return list(set(grps))
+        return list(dict.fromkeys(src.group for src in self.sources))
 
     @property
     def acronym(self):
@@ -1333,24 +1564,15 @@ class CollisionComplex:
 
     @property
     def cia_cross_sections(self):
-        xss = set()
-        for ccomp_alias in self.aliases:
-            xss.update(ccomp_alias.cia_cross_sections)
-        return list(xss)
+        return _unique(ccomp_alias.cia_cross_sections for ccomp_alias in self.aliases)
 
     @property
     def sources(self):
-        srcs = []
-        for xs in self.cia_cross_sections:
-            srcs.append(xs.source)
-        return list(set(srcs))
+        return list(dict.fromkeys(xs.source for xs in self.cia_cross_sections))
 
     @property
     def groups(self):
-        grps = []
-        for src in self.sources:
-            grps.append(src.group)
-        return list(set(grps))
+        return list(dict.fromkeys(src.group for src in self.sources))
 
     #@property
     #def acronym(self):
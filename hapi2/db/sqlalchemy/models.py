@@ -3,7 +3,7 @@ from functools import reduce
 from .base import relationship, declared_attr, query
 
 from hapi2.db import models
-from hapi2.db.models import get_alias_class
+from hapi2.db.models import get_alias_class, TransitionTable
 
 from hapi2.config import VARSPACE, SETTINGS
 
@@ -611,6 +611,18 @@ class Molecule(models.Molecule):
         
         return transs
 
+    @property
+    def transition_table(self):
+        
+        models = VARSPACE['db_backend'].models
+        
+        # fetch the columns only, avoiding creation of the ORM objects
+        rows = self.transitions.with_entities(
+            *[getattr(models.Transition,key) for key,_ in models.Transition.__keys__]
+        ).all()
+        
+        return TransitionTable.from_rows(rows)
+
 @searchable__alias
 class CollisionComplexAlias(models.CollisionComplexAlias):
 
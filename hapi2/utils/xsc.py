@@ -2,6 +2,13 @@ import zlib
 import json
 import pickle
 import struct
+import numpy as np
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 # ___________________________________
 # COMPRESSION
 
@@ -11,6 +18,38 @@ def compress_zlib(data):
 def decompress_zlib(archive):
     return zlib.decompress(archive)
 
+def compress_zstd(data):
+    if zstandard is None:
+        raise Exception('zstandard package is needed to write zstd-compressed data')
+    return zstandard.ZstdCompressor(level=3).compress(data)
+
+def decompress_zstd(archive):
+    if zstandard is None:
+        raise Exception('zstandard package is needed to read zstd-compressed data')
+    return zstandard.ZstdDecompressor().decompress(archive)
+
+# Leading byte of the zstd-compressed blobs. 
+# Plain zlib streams always start with b'x'.
+BLOB_FORMAT_ZSTD = b'\x01'
+
+def compress_blob(data,zstd=False):
+    """
+    Compress with zlib, or with zstd if requested.
+    Level-3 zstd gives about the same size on packed double arrays
+    and inflates several times faster, but reading it needs zstandard.
+    """
+    if zstd:
+        return BLOB_FORMAT_ZSTD + compress_zstd(data)
+    return compress_zlib(data)
+
+def decompress_blob(archive):
+    """
+    Decompress blob made by compress_blob or a legacy zlib blob.
+    """
+    if archive[:1]==BLOB_FORMAT_ZSTD:
+        return decompress_zstd(archive[1:])
+    return decompress_zlib(archive)
+
 # ___________________________________
 # BINARY PACKING
     
@@ -36,6 +75,74 @@ def unpack_double(buf):
     # 8-byte double
     return struct.unpack('%dd'%(len(buf)/8),buf) 
 
+def pack_uint16_quantized(lst):
+    """
+    Quantize values linearly to 2-byte unsigned integers.
+    Return buffer, offset and scale needed for restoring the values.
+    """
+    arr = np.asarray(lst,dtype=np.float64)
+    xmin = float(arr.min()) if arr.size else 0.0
+    xmax = float(arr.max()) if arr.size else 0.0
+    scale = (xmax-xmin)/65535
+    if scale>0:
+        q = np.round((arr-xmin)/scale)
+    else:
+        q = np.zeros(arr.shape)
+    return q.astype('<u2').tobytes(), xmin, scale
+
+def unpack_uint16_quantized(buf,xmin,scale):
+    # 2-byte unsigned integer
+    q = np.frombuffer(buf,dtype='<u2')
+    return q*scale + xmin
+
+# ___________________________________
+# RESAMPLING
+
+def downsample_size(numin,numax,delta):
+    """
+    Number of nodes of the uniform grid from numin to numax with the given step.
+    The tolerance keeps the last node when (numax-numin)/delta is
+    an integer spoiled by the rounding, e.g. 0.3/0.1.
+    """
+    return int(np.floor((numax-numin)/delta+1e-9))+1
+
+def downsample(nu,xsc,delta,type='triangular',numin=None,numax=None,out=None):
+    """
+    Bin the cross-section to the uniform grid with the given step.
+    For "triangular" binning each point is shared between two nearest
+    nodes with linear weights, for "rectangular" it goes to the nearest node.
+    Pre-allocated buffer of the proper size can be supplied in "out".
+    """
+    nu = np.asarray(nu,dtype=np.float64)
+    xsc = np.asarray(xsc,dtype=np.float64)
+    if numin is None: numin = nu[0]
+    if numax is None: numax = nu[-1]
+    n_out = downsample_size(numin,numax,delta)
+    if out is None:
+        out = np.empty(n_out)
+    elif len(out)!=n_out:
+        raise Exception('out must have %d elements, got %d'%(n_out,len(out)))
+    pos = (nu-numin)/delta
+    if type=='triangular':
+        ind = np.floor(pos).astype(np.int64)
+        w = pos-ind
+        ind = np.concatenate((ind,ind+1))
+        wgt = np.concatenate((1-w,w))
+        val = wgt*np.concatenate((xsc,xsc))
+    elif type=='rectangular':
+        ind = np.rint(pos).astype(np.int64)
+        wgt = np.ones(len(ind))
+        val = xsc
+    else:
+        raise Exception('unknown downsampling type: %s'%type)
+    mask = (ind>=0)&(ind<n_out)
+    norm = np.bincount(ind[mask],weights=wgt[mask],minlength=n_out)
+    out[:] = np.bincount(ind[mask],weights=val[mask],minlength=n_out)
+    np.divide(out,norm,out=out,where=norm>0)
+    out[norm==0] = np.nan
+    binned_nu = numin + delta*np.arange(n_out)
+    return binned_nu,out
+
 # ___________________________________
 # JSON PACKING
     
@@ -0,0 +1,42 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # fall back to the pure python versions of the kernels
+    def njit(*args,**kwargs):
+        if len(args)==1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+@njit(cache=True)
+def average_same_points_nb(nu,xsc):
+    """
+    Replace runs of equal wave numbers by a single point
+    with the averaged cross-section. Wave numbers must be sorted.
+    """
+    n = len(nu)
+    nu_out = np.empty(n)
+    xsc_out = np.empty(n)
+    j = -1; cnt = 0
+    for i in range(n):
+        if j>=0 and nu[i]==nu_out[j]:
+            xsc_out[j] += xsc[i]
+            cnt += 1
+        else:
+            if j>=0: xsc_out[j] /= cnt
+            j += 1
+            nu_out[j] = nu[i]
+            xsc_out[j] = xsc[i]
+            cnt = 1
+    if j>=0: xsc_out[j] /= cnt
+    return nu_out[:j+1],xsc_out[:j+1]
+
+@njit(cache=True)
+def range_nb(nu,xsc,numin,numax):
+    """
+    Cut the part of the sorted cross-section within [numin,numax].
+    """
+    i1 = np.searchsorted(nu,numin,side='left')
+    i2 = np.searchsorted(nu,numax,side='right')
+    return nu[i1:i2],xsc[i1:i2]
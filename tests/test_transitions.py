@@ -0,0 +1,168 @@
+import gc
+import random
+
+import numpy as np
+import pytest
+from sqlalchemy.orm import configure_mappers
+
+from hapi import putRowObjectToString
+
+from hapi2.config import VARSPACE
+from hapi2.db import models
+from hapi2.db.models import Transition, parse_par_line_cached, get_state_key, \
+    TransitionTable, make_column, format_par_line, createRowObject
+
+class State:
+    def __init__(self,molec_id,local_iso_id,**qns):
+        self.molec_id = molec_id
+        self.local_iso_id = local_iso_id
+        self.qns = qns
+
+class ParsedTransition:
+    def __init__(self,statep,statepp):
+        self.statep = statep
+        self.statepp = statepp
+
+class StubTransition(Transition):
+    def __init__(self,par_line):
+        self.stub_par_line = par_line
+
+    @property
+    def par_line(self):
+        return self.stub_par_line
+
+@pytest.fixture
+def parsed_lines(monkeypatch):
+    """
+    Replace the HITRAN line parser: line "J" gives the J -> J-1 transition.
+    """
+    parsed_lines = []
+    class HITRANTransition:
+        @staticmethod
+        def parse_par_line(par_line):
+            parsed_lines.append(par_line)
+            J = int(par_line)
+            return ParsedTransition(State(1,1,J=J),State(1,1,J=J-1))
+    monkeypatch.setattr(models,'HITRANTransition',HITRANTransition,raising=False)
+    parse_par_line_cached.cache_clear()
+    yield parsed_lines
+    parse_par_line_cached.cache_clear()
+
+def test_fill_states_parses_line_once(parsed_lines):
+    t1 = StubTransition('5'); t2 = StubTransition('5')
+    assert t1.statep.qns=={'J':5}
+    assert t1.statepp.qns=={'J':4}
+    assert t1.statep is t1.statep
+    assert t2.statep.qns=={'J':5}
+    assert parsed_lines==['5']
+
+def test_state_key_ignores_qns_order():
+    key = get_state_key(State(1,1,J=5,Ka=1))
+    assert get_state_key(State(1,1,Ka=1,J=5))==key
+    assert get_state_key(State(1,2,J=5,Ka=1))!=key
+    assert get_state_key(State(1,1,J=5,Ka=2))!=key
+
+def test_states_are_shared_and_weak(parsed_lines):
+    t1 = StubTransition('5'); t2 = StubTransition('6')
+    # upper state of 5 -> 4 is the lower state of 6 -> 5
+    assert t2.statepp is t1.statep
+    key = get_state_key(t1.statep)
+    assert Transition.__states__[key] is t1.statep
+    del t1,t2
+    parse_par_line_cached.cache_clear()
+    gc.collect()
+    assert key not in Transition.__states__
+
+class Row:
+    pass
+
+def make_row(rnd):
+    row = Row()
+    row.molec_id = rnd.randint(1,60)
+    row.local_iso_id = rnd.randint(0,9)
+    row.nu = rnd.uniform(0,30000)
+    row.sw = rnd.uniform(-1,1)*10**rnd.randint(-30,-18)
+    row.a = rnd.uniform(0,10)*10**rnd.randint(-8,2)
+    row.gamma_air = rnd.choice([rnd.uniform(0,0.2),rnd.uniform(-0.01,0)])
+    row.gamma_self = rnd.uniform(-0.1,1)
+    row.elower = rnd.uniform(-1,5000)
+    row.n_air = rnd.uniform(-1,1)
+    row.delta_air = rnd.uniform(-0.02,0.02)
+    row.global_upper_quanta = '          0 0 0'
+    row.global_lower_quanta = '          0 0 1'
+    row.local_upper_quanta = '     5  4  2   '
+    row.local_lower_quanta = '     6  5  1   '
+    row.ierr = '465532'
+    row.iref = ' 4 5 1 1 2 1'
+    row.line_mixing_flag = ' '
+    row.gp = rnd.uniform(0,100)
+    row.gpp = rnd.uniform(0,100)
+    return row
+
+TRANSITION_KEYS = [key for key,_ in Transition.__keys__]
+
+def make_table(n):
+    rnd = random.Random(0)
+    rows = [make_row(rnd) for _ in range(n)]
+    table = TransitionTable.from_rows(
+        tuple(getattr(row,key,None) for key in TRANSITION_KEYS) for row in rows)
+    return rows,table
+
+def test_make_column():
+    col = make_column([1.5,None],float)
+    assert col.dtype==np.float64 and np.isnan(col[1])
+    assert make_column([1,2],int).dtype==np.int64
+    assert make_column([1.5,2],int).dtype==np.float64
+    assert make_column([1,None],int).dtype==object
+    assert make_column(['a','b'],str).dtype==object
+
+def test_transition_table_columns():
+    rows,table = make_table(10)
+    assert len(table)==10
+    assert np.array_equal(table.nu,[row.nu for row in rows])
+    assert table.molec_id.dtype==np.int64
+    assert table.id.dtype==object # missing ids
+    assert table.extra[0] is None
+
+def test_transition_table_indexing():
+    rows,table = make_table(10)
+    assert table[3].nu==rows[3].nu
+    assert table[-1].nu==rows[-1].nu
+    assert table[np.int64(-10)].nu==rows[0].nu
+    for index in (10,-11):
+        with pytest.raises(IndexError):
+            table[index]
+    with pytest.raises(AttributeError):
+        table[0].no_such_column
+    sub = table[2:5]
+    assert len(sub)==3 and np.array_equal(sub.nu,table.nu[2:5])
+    mask = table.nu>15000
+    assert np.array_equal(table[mask].nu,table.nu[mask])
+    assert [row.nu for row in table[mask]]==[row.nu for row in rows if row.nu>15000]
+
+def test_transition_table_range():
+    _,table = make_table(100)
+    sub = table.range(1000,20000)
+    assert np.all((sub.nu>=1000)&(sub.nu<=20000))
+    assert len(sub)==np.count_nonzero((table.nu>=1000)&(table.nu<=20000))
+
+def test_transition_table_par_line():
+    configure_mappers()
+    rows,table = make_table(50)
+    for row,table_row in zip(rows,table):
+        trans = VARSPACE['db_backend'].models.Transition.\
+            __mapper__.class_manager.new_instance()
+        for key in TRANSITION_KEYS:
+            setattr(trans,key,getattr(row,key,None))
+        assert table_row.par_line==trans.par_line
+    assert table.par_lines==[row.par_line for row in table]
+
+def test_format_par_line():
+    rnd = random.Random(0)
+    for _ in range(2000):
+        row = make_row(rnd)
+        assert format_par_line(row)==putRowObjectToString(createRowObject(row))
+
+def test_state_key_keeps_values_apart():
+    assert get_state_key(State(1,1,J='1'))!=get_state_key(State(1,1,J=1))
+    assert get_state_key(State(1,1,a='1|b=2'))!=get_state_key(State(1,1,a='1',b='2'))
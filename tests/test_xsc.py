@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+
+from hapi2.db.models import CrossSection, CrossSectionData, \
+    XSC_FORMAT_UINT16, NU_FORMAT_UNIFORM, NU_FORMAT_DELTA
+from hapi2.utils.xsc import compress_zlib, pack_double, BLOB_FORMAT_ZSTD, \
+    downsample, downsample_size
+from hapi2.utils.xsc_kernels import average_same_points_nb, range_nb
+
+class StubCrossSection(CrossSection):
+    def __init__(self,data):
+        self.data = data
+
+def test_sorted_cache():
+    data = CrossSectionData(np.array([3.,1.,2.]),np.array([1.,2.,3.]))
+    nu,xsc = data.get_sorted()
+    assert np.array_equal(nu,[1.,2.,3.])
+    assert np.array_equal(xsc,[2.,3.,1.])
+    assert data.get_sorted()[0] is nu
+    data.pack_xsc(np.array([4.,5.,6.]))
+    assert np.array_equal(data.get_sorted()[1],[5.,6.,4.])
+
+def test_range_is_readonly_view():
+    xs = StubCrossSection(CrossSectionData(np.linspace(0,10,11),np.ones(11)))
+    nu,xsc = xs.range(1.5,5.5)
+    assert np.array_equal(nu,[2.,3.,4.,5.])
+    with pytest.raises(ValueError):
+        xsc *= 2
+    assert np.array_equal(xs.data.get_sorted()[1],np.ones(11))
+
+def test_pack_xsc_quantized():
+    nu = np.linspace(0,1,1000)
+    xsc = np.random.RandomState(0).uniform(0,1e-18,len(nu))
+    data = CrossSectionData(nu,xsc,quantize=True)
+    assert data.b__xsc__[:1]==XSC_FORMAT_UINT16
+    assert np.abs(data.unpack_xsc()-xsc).max() <= 1e-18/65535
+    assert CrossSectionData(nu,xsc).b__xsc__[:1]!=XSC_FORMAT_UINT16
+
+def test_pack_nu_uniform():
+    nu = np.linspace(500,1500,20001)
+    data = CrossSectionData(nu,np.ones(len(nu)))
+    assert data.b__nu__[:1]==NU_FORMAT_UNIFORM
+    assert np.array_equal(data.unpack_nu(),nu)
+
+def test_unpack_nu_uniform_sets_sorted():
+    for nu,is_sorted in [(np.linspace(0,10,11),True),(np.linspace(10,0,11),False)]:
+        data = CrossSectionData()
+        data.b__nu__ = CrossSectionData(nu,nu).b__nu__
+        assert np.array_equal(data.unpack_nu(),nu)
+        assert data.__nu_sorted__ is is_sorted
+
+def test_pack_nu_delta():
+    nu = np.array([0.,1.,2.,4.])
+    data = CrossSectionData(nu,np.ones(len(nu)))
+    assert data.b__nu__[:1]==NU_FORMAT_DELTA
+    assert np.array_equal(data.unpack_nu(),nu)
+
+def test_pack_nu_random_is_exact():
+    nu = np.sort(np.random.RandomState(0).uniform(500,5000,10000))
+    data = CrossSectionData(nu,np.ones(len(nu)))
+    assert np.array_equal(data.unpack_nu(),nu)
+
+def test_unpack_legacy_zlib():
+    nu = np.array([3.,1.,2.]); xsc = np.array([1.,2.,3.])
+    data = CrossSectionData()
+    data.b__nu__ = compress_zlib(pack_double(nu))
+    data.b__xsc__ = compress_zlib(pack_double(xsc))
+    assert data.b__nu__[:1]==b'x'
+    assert np.array_equal(data.unpack_nu(),nu)
+    assert np.array_equal(data.unpack_xsc(),xsc)
+
+def test_pack_zstd():
+    pytest.importorskip('zstandard')
+    nu = np.array([3.,1.,2.]); xsc = np.array([1.,2.,3.])
+    data = CrossSectionData(nu,xsc,zstd=True)
+    assert data.b__nu__[:1]==NU_FORMAT_DELTA
+    assert data.b__nu__[9:10]==BLOB_FORMAT_ZSTD
+    assert data.b__xsc__[:1]==BLOB_FORMAT_ZSTD
+    assert np.array_equal(data.unpack_nu(),nu)
+    assert np.array_equal(data.unpack_xsc(),xsc)
+    # zlib stays the default
+    assert CrossSectionData(nu,xsc).b__xsc__[:1]==b'x'
+
+def test_average_same_points_nb():
+    nu = np.array([1.,1.,2.,3.,3.,3.])
+    xsc = np.array([1.,3.,5.,1.,2.,3.])
+    nu_avg,xsc_avg = average_same_points_nb(nu,xsc)
+    assert np.array_equal(nu_avg,[1.,2.,3.])
+    assert np.array_equal(xsc_avg,[2.,5.,2.])
+
+def test_range_nb_bounds_inclusive():
+    nu = np.linspace(0,10,11)
+    nu_cut,xsc_cut = range_nb(nu,2*nu,2.0,5.0)
+    assert np.array_equal(nu_cut,[2.,3.,4.,5.])
+    assert np.array_equal(xsc_cut,[4.,6.,8.,10.])
+    nu_cut,_ = range_nb(nu,nu,2.5,2.7)
+    assert len(nu_cut)==0
+
+def test_downsample():
+    nu = np.linspace(0,10,1001)
+    binned_nu,binned_xsc = downsample(nu,np.ones(len(nu)),0.5)
+    assert len(binned_nu)==21
+    assert np.allclose(binned_xsc,1)
+
+def test_downsample_keeps_last_node():
+    # 0.3/0.1 is 2.9999999999999996 in floating point
+    assert downsample_size(0,0.3,0.1)==4
+    binned_nu,binned_xsc = downsample([0,.1,.2,.3],np.ones(4),.1)
+    assert np.allclose(binned_nu,[0,.1,.2,.3])
+    assert np.allclose(binned_xsc,1)
+    xs = StubCrossSection(CrossSectionData(np.array([0,.1,.2,.3]),np.ones(4)))
+    assert len(xs.downsample(.1)[0])==4
+
+def test_downsample_out_size():
+    nu = np.linspace(0,10,1001)
+    out = np.empty(21)
+    _,binned_xsc = downsample(nu,np.ones(len(nu)),0.5,'rectangular',out=out)
+    assert binned_xsc is out
+    with pytest.raises(Exception):
+        downsample(nu,np.ones(len(nu)),0.5,out=np.empty(20))